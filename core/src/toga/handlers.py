@@ -196,6 +196,27 @@ def wrapped_handler(
     return _handler
 
 
+# Native handlers aren't wrapped, so they have no `_raw` attribute to compare.
+_MISSING = object()
+
+
+def is_wrapped_handler(
+    wrapped: WrappedHandlerT | None,
+    handler: HandlerT | NativeHandler | None,
+) -> bool:
+    """Determine if a wrapped handler was produced by wrapping a specific handler.
+
+    This allows a handler setter to avoid re-wrapping (and re-configuring the backend)
+    when it is assigned the handler it already has.
+
+    :param wrapped: The currently installed wrapped handler, or None if no handler
+        has been installed yet.
+    :param handler: The handler being assigned.
+    :returns: True if `wrapped` is the result of wrapping `handler`.
+    """
+    return getattr(wrapped, "_raw", _MISSING) is handler
+
+
 class OnResultT(Protocol):
     def __call__(self, result: Any, exception: Exception | None = None) -> object: ...
 
@@ -29,17 +29,20 @@ _TOGA_INTERFACES = {"toga_core"}
 
 
 def get_current_platform() -> str | None:
-    # Rely on `sys.getandroidapilevel`, which only exists on Android; see
-    # https://github.com/beeware/Python-Android-support/issues/8
-    if hasattr(sys, "getandroidapilevel"):
-        return "android"
-    elif sys.platform.startswith("freebsd"):
+    platform = _TOGA_PLATFORMS.get(sys.platform)
+    if platform == "linux":
+        # Before Python 3.13, Android reported a platform of "linux". Rely on
+        # `sys.getandroidapilevel`, which only exists on Android; see
+        # https://github.com/beeware/Python-Android-support/issues/8
+        if hasattr(sys, "getandroidapilevel"):
+            return "android"
+    elif platform is None and sys.platform.startswith("freebsd"):
+        # FreeBSD includes the major version number in the platform name.
         return "freeBSD"
-    else:
-        return _TOGA_PLATFORMS.get(sys.platform)
+    return platform
 
 
-current_platform: str = get_current_platform()
+current_platform: str
 """A string identifier of the platform on which the application is currently running.
 One of:
 
@@ -61,12 +64,15 @@ used by `current_platform` do not exactly match the names returned by
 """
 
 
+@cache
 def find_backends():
     # As of Setuptools 65.5, entry points are returned duplicated if the package is
     # installed editable. Use a set to ensure that each entry point is only returned
     # once.
     # See https://github.com/pypa/setuptools/issues/3649
-    return sorted(set(entry_points(group="toga.backends")))
+    #
+    # The result is cached, so it's returned as a tuple to ensure it can't be modified.
+    return tuple(sorted(set(entry_points(group="toga.backends"))))
 
 
 def _backends_list(backends):
@@ -79,37 +85,35 @@ def get_backend():
         return backend
 
     installed_backends = find_backends()
-    match len(installed_backends):
-        case 0:
-            raise RuntimeError("No Toga backend could be found.")
-        case 1:
-            return installed_backends[0].value
-        case _:
-            # Multiple backends are installed: choose the one that matches the host
-            # platform.
-            matching_backends = [
-                backend
-                for backend in installed_backends
-                if backend.name == current_platform
-            ]
-            match len(matching_backends):
-                case 0:
-                    backends_list = _backends_list(installed_backends)
-                    raise RuntimeError(
-                        f"Multiple Toga backends are installed ({backends_list}), "
-                        f"but none of them match your current platform "
-                        f"({current_platform!r}). Install a backend for your current "
-                        f"platform, or use TOGA_BACKEND to specify a backend."
-                    )
-                case 1:
-                    return matching_backends[0].value
-                case _:
-                    backends_list = _backends_list(matching_backends)
-                    raise RuntimeError(
-                        f"Multiple candidate toga backends found: ({backends_list}). "
-                        f"Uninstall the backends you don't require, or use "
-                        f"TOGA_BACKEND to specify a backend."
-                    )
+    if not installed_backends:
+        raise RuntimeError("No Toga backend could be found.")
+
+    if len(installed_backends) == 1:
+        return installed_backends[0].value
+
+    # Multiple backends are installed: choose the one that matches the host platform.
+    platform = get_current_platform()
+    matching_backends = [
+        backend for backend in installed_backends if backend.name == platform
+    ]
+    if not matching_backends:
+        backends_list = _backends_list(installed_backends)
+        raise RuntimeError(
+            f"Multiple Toga backends are installed ({backends_list}), "
+            f"but none of them match your current platform "
+            f"({platform!r}). Install a backend for your current "
+            f"platform, or use TOGA_BACKEND to specify a backend."
+        )
+
+    if len(matching_backends) == 1:
+        return matching_backends[0].value
+
+    backends_list = _backends_list(matching_backends)
+    raise RuntimeError(
+        f"Multiple candidate toga backends found: ({backends_list}). "
+        f"Uninstall the backends you don't require, or use "
+        f"TOGA_BACKEND to specify a backend."
+    )
 
 
 @cache
@@ -228,21 +232,26 @@ def get_factory(interface: str | None = None) -> Factory | ModuleType:
     # 2026-02: Backwards compatibility for version <= 0.5.3
     # -------------------------------------------------------------------------
     # If we can't find the entrypoint group we expect, drop back to the old system using
-    # a factory module
-    if interface is None and len(entry_points(group=factory.group)) == 0:
-        backend = get_backend()
-        try:
-            factory = importlib.import_module(f"{backend}.factory")
-        except ModuleNotFoundError as exc:
-            toga_backends_values = ", ".join([f"{b.value!r}" for b in find_backends()])
-            # Android doesn't report Python exception chains in crashes
-            # (https://github.com/chaquo/chaquopy/issues/890), so include the original
-            # exception message in case the backend does exist but throws a
-            # ModuleNotFoundError from one of its internal imports.
-            raise RuntimeError(
-                f"The backend specified by TOGA_BACKEND ({backend!r}) could "
-                f"not be loaded ({exc}). It should be one of: {toga_backends_values}."
-            ) from exc
+    # a factory module. Load the factory's entry points eagerly so that this check
+    # reuses the same metadata scan, rather than performing a second one.
+    if interface is None:
+        factory._load_entrypoints()
+        if not factory._entrypoints:
+            backend = get_backend()
+            try:
+                factory = importlib.import_module(f"{backend}.factory")
+            except ModuleNotFoundError as exc:
+                toga_backends_values = ", ".join(
+                    [f"{b.value!r}" for b in find_backends()]
+                )
+                # Android doesn't report Python exception chains in crashes
+                # (https://github.com/chaquo/chaquopy/issues/890), so include the
+                # original exception message in case the backend does exist but
+                # throws a ModuleNotFoundError from one of its internal imports.
+                raise RuntimeError(
+                    f"The backend specified by TOGA_BACKEND ({backend!r}) could not "
+                    f"be loaded ({exc}). It should be one of: {toga_backends_values}."
+                ) from exc
     # -------------------------------------------------------------------------
     # End backwards compatibility
     # -------------------------------------------------------------------------
@@ -260,5 +269,9 @@ def __getattr__(name):
         global backend
         backend = get_backend()
         return backend
+    elif name == "current_platform":
+        global current_platform
+        current_platform = get_current_platform()
+        return current_platform
     else:
         raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
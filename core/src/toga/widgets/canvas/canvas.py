@@ -12,11 +12,7 @@ from weakref import WeakSet
 
 import toga
 from toga.colors import BLACK, Color
-from toga.fonts import (
-    SYSTEM,
-    SYSTEM_DEFAULT_FONT_SIZE,
-    Font,
-)
+from toga.fonts import Font
 from toga.handlers import wrapped_handler
 
 from ..base import StyleT, Widget
@@ -27,6 +23,7 @@ from .drawingaction import (
     SetLineDash,
     SetLineWidth,
     SetStrokeStyle,
+    _font_impl,
 )
 from .state import BaseState, DrawingActionDispatch, State
 
@@ -383,10 +380,7 @@ class Canvas(Widget, DrawingActionDispatch):
             when multiple lines are present.
         :returns: A tuple of `(width, height)`.
         """
-        if font is None:
-            font = Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)
-
-        return self._impl.measure_text(str(text), font._impl, line_height)
+        return self._impl.measure_text(str(text), _font_impl(font), line_height)
 
     def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
         """Render the canvas as an image.
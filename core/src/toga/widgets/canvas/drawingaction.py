@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from dataclasses import KW_ONLY, InitVar, dataclass, fields, is_dataclass
 from enum import Enum
+from functools import cache
 from math import pi
 from typing import TYPE_CHECKING, Any
 from warnings import filterwarnings, warn
@@ -32,22 +33,20 @@ filterwarnings("default", category=DeprecationWarning)
 
 
 def _determine_counterclockwise(anticlockwise, counterclockwise):
-    num_supplied = sum(value is not None for value in [anticlockwise, counterclockwise])
-    if num_supplied == 0:
-        return False
-    if num_supplied == 1:
-        if anticlockwise is not None:
-            warn(
-                "Parameter 'anticlockwise' is deprecated. Use 'counterclockwise' "
-                "instead.",
-                DeprecationWarning,
-                stacklevel=3,
-            )
-            return anticlockwise
+    if anticlockwise is None:
+        return False if counterclockwise is None else counterclockwise
 
-        return counterclockwise
+    if counterclockwise is not None:
+        raise TypeError(
+            "Received both 'anticlockwise' and 'counterclockwise' arguments"
+        )
 
-    raise TypeError("Received both 'anticlockwise' and 'counterclockwise' arguments")
+    warn(
+        "Parameter 'anticlockwise' is deprecated. Use 'counterclockwise' instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return anticlockwise
 
 
 ######################################################################
@@ -69,6 +68,10 @@ class DrawingAction(ABC):
     their classes have the same names, but capitalized.
     """
 
+    # Canvases can contain very many drawing actions, so subclasses use slots where
+    # possible to reduce their memory footprint.
+    __slots__ = ()
+
     def __repr__(self) -> str:
         if is_dataclass(self):
             str_fields = []
@@ -105,28 +108,46 @@ class DrawingAction(ABC):
 NOT_PROVIDED = object()
 
 
+@cache
+def _default_font() -> Font:
+    # Created on first use, rather than at import, because a Font requires a backend.
+    return Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)
+
+
+def _font_impl(font: Font | None) -> Any:
+    """Return the backend implementation of a font, or of the default system font."""
+    return (font if font is not None else _default_font())._impl
+
+
 class color_property:
     def __init__(self, aliased=False):
         self.aliased = aliased
 
     def __set_name__(self, action_class, name):
         self.name = name
+        # Aliased properties all share the same underlying storage.
+        self.private_name = "_color" if self.aliased else f"_{name}"
 
     def __get__(self, action, action_class=None):
         if action is None:
             return self
 
-        return action._color if self.aliased else getattr(action, f"_{self.name}")
+        return getattr(action, self.private_name)
 
     def __set__(self, action, value):
-        if value not in {None, NOT_PROVIDED, self}:
+        # Sentinel values are stored as-is, and a Color doesn't need to be parsed.
+        if not (
+            value is None
+            or value is NOT_PROVIDED
+            or value is self
+            or isinstance(value, Color)
+        ):
             value = Color.parse(value)
 
-        if self.aliased:
-            action._color = value
-        else:
-            value = None if value is self else value
-            setattr(action, f"_{self.name}", value)
+        if not self.aliased and value is self:
+            value = None
+
+        setattr(action, self.private_name, value)
 
 
 ###########################################################################
@@ -139,6 +160,8 @@ class Save(DrawingAction):
     [save()][toga.Canvas.save] method.
     """
 
+    __slots__ = ()
+
     def _draw(self, context: Any) -> None:
         context.save()
 
@@ -148,6 +171,8 @@ class Restore(DrawingAction):
     [restore()][toga.Canvas.restore] method.
     """
 
+    __slots__ = ()
+
     def _draw(self, context: Any) -> None:
         context.restore()
 
@@ -181,7 +206,7 @@ class SetStrokeStyle(DrawingAction):
         context.set_stroke_style(self.stroke_style)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class SetLineDash(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing assigning
     to the [line_dash][toga.Canvas.line_dash] context attribute.
@@ -193,7 +218,7 @@ class SetLineDash(DrawingAction):
         context.set_line_dash(self.line_dash)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class SetLineWidth(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing assigning
     to the [line_width][toga.Canvas.line_width] context attribute.
@@ -215,11 +240,13 @@ class BeginPath(DrawingAction):
     [begin_path()][toga.Canvas.begin_path] method.
     """
 
+    __slots__ = ()
+
     def _draw(self, context: Any) -> None:
         context.begin_path()
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class MoveTo(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [move_to()][toga.Canvas.move_to] method.
@@ -232,7 +259,7 @@ class MoveTo(DrawingAction):
         context.move_to(self.x, self.y)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class LineTo(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [line_to()][toga.Canvas.line_to] method.
@@ -245,7 +272,7 @@ class LineTo(DrawingAction):
         context.line_to(self.x, self.y)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class BezierCurveTo(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [bezier_curve_to()][toga.Canvas.bezier_curve_to] method.
@@ -264,7 +291,7 @@ class BezierCurveTo(DrawingAction):
         )
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class QuadraticCurveTo(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [quadratic_curve_to()][toga.Canvas.quadratic_curve_to] method.
@@ -279,7 +306,7 @@ class QuadraticCurveTo(DrawingAction):
         context.quadratic_curve_to(self.cpx, self.cpy, self.x, self.y)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class Arc(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [arc()][toga.Canvas.arc] method.
@@ -317,7 +344,7 @@ class Arc(DrawingAction):
         )
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class Ellipse(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [ellipse()][toga.Canvas.ellipse] method.
@@ -360,7 +387,7 @@ class Ellipse(DrawingAction):
         )
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class Rect(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [rect()][toga.Canvas.rect] method.
@@ -375,7 +402,7 @@ class Rect(DrawingAction):
         context.rect(self.x, self.y, self.width, self.height)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class RoundRect(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [round_rect()][toga.Canvas.round_rect] method.
@@ -396,7 +423,7 @@ class RoundRect(DrawingAction):
 ###########################################################################
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class WriteText(DrawingAction):
     def __post_init__(self):
         warn(
@@ -420,11 +447,7 @@ class WriteText(DrawingAction):
             str(self.text),
             self.x,
             self.y,
-            (
-                self.font._impl
-                if self.font is not None
-                else Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)._impl
-            ),
+            _font_impl(self.font),
             self.baseline,
             self.line_height,
         )
@@ -434,7 +457,7 @@ class WriteText(DrawingAction):
             context.stroke_text(*args)
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class FillText(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [fill_text()][toga.Canvas.fill_text] method.
@@ -454,17 +477,13 @@ class FillText(DrawingAction):
             str(self.text),
             self.x,
             self.y,
-            (
-                self.font._impl
-                if self.font is not None
-                else Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)._impl
-            ),
+            _font_impl(self.font),
             self.baseline,
             self.line_height,
         )
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class StrokeText(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [stroke_text()][toga.Canvas.stroke_text] method.
@@ -484,11 +503,7 @@ class StrokeText(DrawingAction):
             str(self.text),
             self.x,
             self.y,
-            (
-                self.font._impl
-                if self.font is not None
-                else Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)._impl
-            ),
+            _font_impl(self.font),
             self.baseline,
             self.line_height,
         )
@@ -499,7 +514,7 @@ class StrokeText(DrawingAction):
 ###########################################################################
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class DrawImage(DrawingAction):
     """The [`DrawingAction`][toga.widgets.canvas.DrawingAction] representing the
     [draw_image()][toga.Canvas.draw_image] method.
@@ -531,5 +546,7 @@ class ResetTransform(DrawingAction):
     [reset_transform()][toga.Canvas.reset_transform] method.
     """
 
+    __slots__ = ()
+
     def _draw(self, context: Any) -> None:
         context.reset_transform()
@@ -4,7 +4,7 @@ from collections.abc import Iterable
 from typing import Any, Literal, Protocol
 
 import toga
-from toga.handlers import wrapped_handler
+from toga.handlers import is_wrapped_handler, wrapped_handler
 from toga.sources import ListSource, ListSourceT, Row, Source
 
 from .base import StyleT, Widget
@@ -165,11 +165,12 @@ class DetailedList(Widget):
         :param row: The index of the row to make visible. Negative values refer to the
             nth last row (-1 is the last row, -2 second last, and so on).
         """
-        if len(self.data) > 1:
+        n_rows = len(self.data)
+        if n_rows > 1:
             if row >= 0:
-                self._impl.scroll_to_row(min(row, len(self.data)))
+                self._impl.scroll_to_row(min(row, n_rows))
             else:
-                self._impl.scroll_to_row(max(len(self.data) + row, 0))
+                self._impl.scroll_to_row(max(n_rows + row, 0))
 
     def scroll_to_bottom(self) -> None:
         """Scroll the view so that the bottom of the list (last row) is visible."""
@@ -213,6 +214,8 @@ class DetailedList(Widget):
 
     @on_primary_action.setter
     def on_primary_action(self, handler: OnPrimaryActionHandler) -> None:
+        if is_wrapped_handler(getattr(self, "_on_primary_action", None), handler):
+            return
         self._on_primary_action = wrapped_handler(self, handler)
         self._impl.set_primary_action_enabled(handler is not None)
 
@@ -231,6 +234,8 @@ class DetailedList(Widget):
 
     @on_secondary_action.setter
     def on_secondary_action(self, handler: OnSecondaryActionHandler) -> None:
+        if is_wrapped_handler(getattr(self, "_on_secondary_action", None), handler):
+            return
         self._on_secondary_action = wrapped_handler(self, handler)
         self._impl.set_secondary_action_enabled(handler is not None)
 
@@ -246,6 +251,8 @@ class DetailedList(Widget):
 
     @on_refresh.setter
     def on_refresh(self, handler: OnRefreshHandler) -> None:
+        if is_wrapped_handler(getattr(self, "_on_refresh", None), handler):
+            return
         self._on_refresh = wrapped_handler(
             self, handler, cleanup=self._impl.after_on_refresh
         )
@@ -259,4 +266,6 @@ class DetailedList(Widget):
 
     @on_select.setter
     def on_select(self, handler: toga.widgets.detailedlist.OnSelectHandler) -> None:
+        if is_wrapped_handler(getattr(self, "_on_select", None), handler):
+            return
         self._on_select = wrapped_handler(self, handler)
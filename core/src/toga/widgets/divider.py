@@ -31,7 +31,8 @@ class Divider(Widget):
         """
         super().__init__(id, style, **kwargs)
 
-        self.direction = direction
+        # The backend may not be able to report a direction until one has been set.
+        self._set_direction(direction)
 
     def _create(self) -> Any:
         return self.factory.Divider(interface=self)
@@ -60,5 +61,9 @@ class Divider(Widget):
 
     @direction.setter
     def direction(self, value: object) -> None:
+        if value != self.direction:
+            self._set_direction(value)
+
+    def _set_direction(self, value: object) -> None:
         self._impl.set_direction(value)
         self.refresh()
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
 from typing import Any, Protocol, SupportsFloat
 
 import toga
-from toga.handlers import wrapped_handler
+from toga.handlers import is_wrapped_handler, wrapped_handler
 
 from .base import StyleT, Widget
 
@@ -37,6 +36,39 @@ class OnReleaseHandler(Protocol):
         """
 
 
+# A no-op handler, shared by all sliders that don't have a handler installed.
+_NO_HANDLER = wrapped_handler(None, None)
+
+
+# Backends are inconsistent about when they produce events for programmatic changes,
+# so we deal with those in the interface layer. Each slider keeps a single instance of
+# this context manager, because it is entered on every programmatic change.
+class _ProgrammaticChange:
+    __slots__ = ("_slider", "_old_value", "_on_change")
+
+    def __init__(self, slider: Slider):
+        self._slider = slider
+
+    def __enter__(self) -> float:
+        slider = self._slider
+        self._old_value = slider.value
+        self._on_change = slider._on_change
+        slider._on_change = _NO_HANDLER
+        return self._old_value
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Read the saved state before invoking the handler, because the handler may
+        # make another programmatic change, re-entering this context manager. Then
+        # clear it, so this long-lived object doesn't keep the handler alive.
+        slider = self._slider
+        old_value = self._old_value
+        on_change = self._on_change
+        self._old_value = self._on_change = None
+        slider._on_change = on_change
+        if exc_type is None and slider.value != old_value:
+            on_change()
+
+
 class Slider(Widget):
     _MIN_WIDTH = 100
 
@@ -73,9 +105,12 @@ class Slider(Widget):
         """
         super().__init__(id, style, **kwargs)
 
-        # Set a dummy handler before installing the actual on_change, because we do not
-        # want on_change triggered by the initial value being set
-        self.on_change = None
+        self._programmatic_change = _ProgrammaticChange(self)
+
+        # Install no-op handlers before the actual handlers, because we do not want
+        # on_change triggered by the initial value being set. This also means that a
+        # handler of None doesn't need to be wrapped.
+        self._on_change = self._on_press = self._on_release = _NO_HANDLER
         self.min = min
         self.max = max
         self.tick_count = tick_count
@@ -92,19 +127,6 @@ class Slider(Widget):
     def _create(self) -> Any:
         return self.factory.Slider(interface=self)
 
-    # Backends are inconsistent about when they produce events for programmatic changes,
-    # so we deal with those in the interface layer.
-    @contextmanager
-    def _programmatic_change(self) -> float:
-        old_value = self.value
-        on_change = self._on_change
-        self.on_change = None
-        yield old_value
-
-        self._on_change = on_change
-        if self.value != old_value:
-            on_change()
-
     @property
     def value(self) -> float:
         """Current value.
@@ -121,8 +143,12 @@ class Slider(Widget):
             value = self.min
         elif value > self.max:
             value = self.max
-        with self._programmatic_change():
-            self._set_value(value)
+
+        value = self._round_value(float(value))
+        # Avoid a backend update if the value isn't changing.
+        if value != self.value:
+            with self._programmatic_change:
+                self._impl.set_value(value)
 
     def _set_value(self, value: SupportsFloat) -> None:
         self._impl.set_value(self._round_value(float(value)))
@@ -131,7 +157,8 @@ class Slider(Widget):
         step = self.tick_step
         if step is not None:
             # Round to the nearest tick.
-            value = self.min + round((value - self.min) / step) * step
+            _min = self.min
+            value = _min + round((value - _min) / step) * step
         return value
 
     @property
@@ -146,7 +173,7 @@ class Slider(Widget):
 
     @min.setter
     def min(self, value: SupportsFloat) -> None:
-        with self._programmatic_change() as old_value:
+        with self._programmatic_change as old_value:
             # Some backends will clip the current value within the range automatically,
             # but do it ourselves to be certain. In discrete mode, setting self.value
             # also rounds to the new positions of the ticks.
@@ -171,7 +198,7 @@ class Slider(Widget):
 
     @max.setter
     def max(self, value: SupportsFloat) -> None:
-        with self._programmatic_change() as old_value:
+        with self._programmatic_change as old_value:
             # Some backends will clip the current value within the range automatically,
             # but do it ourselves to be certain. In discrete mode, setting self.value
             # also rounds to the new positions of the ticks.
@@ -211,13 +238,15 @@ class Slider(Widget):
     def tick_count(self, tick_count: float | None) -> None:
         if (tick_count is not None) and (tick_count < 2):
             raise ValueError("tick count must be at least 2")
-        with self._programmatic_change() as old_value:
+        with self._programmatic_change as old_value:
             # Some backends will round the current value to the nearest tick
             # automatically, but do it ourselves to be certain. Some backends also
             # require the value to be refreshed when moving between discrete and
             # continuous mode, because this causes a change in the native range.
+            # The old value is already within the range, so it doesn't need to be
+            # clipped again.
             self._impl.set_tick_count(tick_count)
-            self.value = old_value
+            self._set_value(old_value)
 
     @property
     def tick_step(self) -> float | None:
@@ -230,9 +259,15 @@ class Slider(Widget):
         This property is read-only, and depends on the values of
         [`tick_count`][toga.Slider.tick_count] and [`range`][].
         """
-        if self.tick_count is None or self.max == self.min:
+        # Each of these properties is a backend call, so only read them once.
+        tick_count = self.tick_count
+        if tick_count is None:
+            return None
+        _min = self.min
+        _max = self.max
+        if _max == _min:
             return None
-        return (self.max - self.min) / (self.tick_count - 1)
+        return (_max - _min) / (tick_count - 1)
 
     @property
     def tick_value(self) -> float | None:
@@ -245,8 +280,11 @@ class Slider(Widget):
 
         :raises ValueError: If set to anything inconsistent with the rules above.
         """
-        if self.tick_count is not None and self.tick_step is not None:
-            return round((self.value - self.min) / self.tick_step) + 1
+        # The tick step is None whenever the slider is continuous, so there's no need
+        # to check the tick count separately.
+        step = self.tick_step
+        if step is not None:
+            return round((self.value - self.min) / step) + 1
         else:
             return None
 
@@ -256,11 +294,12 @@ class Slider(Widget):
             if tick_value is not None:
                 raise ValueError("cannot set tick value when tick count is None")
         else:
-            if tick_value is None or self.tick_step is None:
+            step = self.tick_step
+            if tick_value is None or step is None:
                 raise ValueError(
                     "cannot set tick value to None when tick count is not None"
                 )
-            self.value = self.min + (tick_value - 1) * self.tick_step
+            self.value = self.min + (tick_value - 1) * step
 
     @property
     def on_change(self) -> OnChangeHandler:
@@ -273,6 +312,8 @@ class Slider(Widget):
 
     @on_change.setter
     def on_change(self, handler: toga.widgets.slider.OnChangeHandler) -> None:
+        if is_wrapped_handler(self._on_change, handler):
+            return
         self._on_change = wrapped_handler(self, handler)
 
     @property
@@ -282,6 +323,8 @@ class Slider(Widget):
 
     @on_press.setter
     def on_press(self, handler: toga.widgets.slider.OnPressHandler) -> None:
+        if is_wrapped_handler(self._on_press, handler):
+            return
         self._on_press = wrapped_handler(self, handler)
 
     @property
@@ -291,6 +334,8 @@ class Slider(Widget):
 
     @on_release.setter
     def on_release(self, handler: OnReleaseHandler) -> None:
+        if is_wrapped_handler(self._on_release, handler):
+            return
         self._on_release = wrapped_handler(self, handler)
 
 
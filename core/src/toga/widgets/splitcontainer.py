@@ -56,7 +56,7 @@ class SplitContainer(Widget):
 
         if content:
             self.content = content
-        self.direction = direction
+        self._set_direction(direction)
 
     def _create(self) -> Any:
         return self.factory.SplitContainer(interface=self)
@@ -98,11 +98,6 @@ class SplitContainer(Widget):
 
     @content.setter
     def content(self, content: Sequence[SplitContainerContentT]) -> None:
-        for old_content in self._content:
-            if old_content is not None:
-                old_content.app = None
-                old_content.window = None
-
         try:
             if len(content) != 2:
                 raise TypeError()
@@ -112,6 +107,7 @@ class SplitContainer(Widget):
             ) from exc
 
         _content = []
+        _impls = []
         flex = []
         for item in content:
             match item:
@@ -130,17 +126,23 @@ class SplitContainer(Widget):
                     )
 
             _content.append(widget)
+            _impls.append(widget._impl if widget is not None else None)
             flex.append(flex_value)
 
+        # Only detach old content that isn't being retained; re-assigning a retained
+        # widget would remove it from (and then re-add it to) the widget registry.
+        for old_content in self._content:
+            if old_content is not None and old_content not in _content:
+                old_content.app = None
+                old_content.window = None
+
+        for widget in _content:
             if widget:
                 widget.app = self.app
                 widget.window = self.window
 
-        self._impl.set_content(
-            [w._impl if w is not None else None for w in _content],
-            flex,
-        )
-        self._content = list(_content)
+        self._impl.set_content(_impls, flex)
+        self._content = _content
         self.refresh()
 
     @Widget.app.setter
@@ -170,5 +172,9 @@ class SplitContainer(Widget):
 
     @direction.setter
     def direction(self, value: object) -> None:
+        if value != self.direction:
+            self._set_direction(value)
+
+    def _set_direction(self, value: object) -> None:
         self._impl.set_direction(value)
         self.refresh()
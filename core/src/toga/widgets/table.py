@@ -320,11 +320,12 @@ class Table(Widget, Generic[Value]):
         :param row: The index of the row to make visible. Negative values refer to the
             nth last row (-1 is the last row, -2 second last, and so on).
         """
-        if len(self.data) > 1:
+        n_rows = len(self.data)
+        if n_rows > 1:
             if row >= 0:
-                self._impl.scroll_to_row(min(row, len(self.data)))
+                self._impl.scroll_to_row(min(row, n_rows))
             else:
-                self._impl.scroll_to_row(max(len(self.data) + row, 0))
+                self._impl.scroll_to_row(max(n_rows + row, 0))
 
     def scroll_to_bottom(self) -> None:
         """Scroll the view so that the bottom of the list (last row) is visible."""
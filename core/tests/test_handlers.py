@@ -8,6 +8,7 @@ from toga.handlers import (
     AsyncResult,
     NativeHandler,
     WeakrefCallable,
+    is_wrapped_handler,
     simple_handler,
     wrapped_handler,
 )
@@ -637,6 +638,40 @@ async def test_simple_handler_coroutine():
     }
 
 
+def test_is_wrapped_handler():
+    """A wrapped handler can be matched against the handler it wraps."""
+    obj = Mock()
+    handler = Mock()
+    other_handler = Mock()
+
+    # Nothing has been wrapped yet
+    assert not is_wrapped_handler(None, handler)
+    assert not is_wrapped_handler(None, None)
+
+    wrapped = wrapped_handler(obj, handler)
+    assert is_wrapped_handler(wrapped, handler)
+    assert not is_wrapped_handler(wrapped, other_handler)
+    assert not is_wrapped_handler(wrapped, None)
+
+    noop = wrapped_handler(obj, None)
+    assert is_wrapped_handler(noop, None)
+    assert not is_wrapped_handler(noop, handler)
+
+    # A native handler is never considered to be a match, because the
+    # NativeHandler wrapper isn't retained.
+    native = NativeHandler(handler)
+    assert not is_wrapped_handler(wrapped_handler(obj, native), native)
+
+    # Nor is the function contained in a native handler a match for itself, because
+    # it needs to be wrapped before it can be used as a handler.
+    def native_function():
+        pass
+
+    installed = wrapped_handler(obj, NativeHandler(native_function))
+    assert installed is native_function
+    assert not is_wrapped_handler(installed, native_function)
+
+
 ######################################################################
 # 2023-12: Backwards compatibility for <= 0.4.0
 ######################################################################
@@ -7,6 +7,9 @@ import pytest
 
 import toga
 
+TESTBED_PATH = Path(__file__).parent / "testbed"
+TOGA_PATH = Path(toga.__file__).parent.resolve()
+
 
 def run_app(args, cwd):
     """Run a Toga app as a subprocess with coverage enabled and the Toga Dummy
@@ -19,7 +22,7 @@ def run_app(args, cwd):
             "COVERAGE_PROCESS_START": str(
                 Path(__file__).parent.parent / "pyproject.toml"
             ),
-            "PYTHONPATH": str(Path(__file__).parent / "testbed/customize"),
+            "PYTHONPATH": str(TESTBED_PATH / "customize"),
             "TOGA_BACKEND": "toga_dummy",
         }
     )
@@ -39,7 +42,7 @@ def run_app(args, cwd):
 
 def assert_paths(output, app_path, app_name):
     """Assert the paths for the standalone app are consistent."""
-    results = output.splitlines()
+    results = set(output.splitlines())
     assert f"app.paths.app={app_path.resolve()}" in results
     home = Path.home()
     full_name = f"org.testbed.{app_name}"
@@ -47,13 +50,13 @@ def assert_paths(output, app_path, app_name):
     assert f"app.paths.data={home / 'user_data' / full_name}" in results
     assert f"app.paths.cache={home / 'cache' / full_name}" in results
     assert f"app.paths.logs={home / 'logs' / full_name}" in results
-    assert f"app.paths.toga={Path(toga.__file__).parent.resolve()}" in results
+    assert f"app.paths.toga={TOGA_PATH}" in results
 
 
 def test_as_interactive():
     """At an interactive prompt, the app path is the current working directory."""
     # Spawn the interactive-mode mocking entry point
-    cwd = Path(__file__).parent / "testbed"
+    cwd = TESTBED_PATH
     output = run_app(["interactive.py"], cwd=cwd)
     assert_paths(output, app_path=cwd, app_name="interactive-app")
 
@@ -62,43 +65,43 @@ def test_simple_as_file_in_module():
     """When a simple app is started as `python app.py` inside a runnable module, the app
     path is the folder holding app.py."""
     # Spawn the simple testbed app using `app.py`
-    cwd = Path(__file__).parent / "testbed/simple"
+    cwd = TESTBED_PATH / "simple"
     output = run_app(["app.py"], cwd=cwd)
-    assert_paths(output, app_path=Path(toga.__file__).parent, app_name="simple-app")
+    assert_paths(output, app_path=TOGA_PATH, app_name="simple-app")
 
 
 def test_simple_as_module():
     """When a simple apps is started as `python -m app` inside a runnable module, the
     app path is the folder holding app.py."""
     # Spawn the simple testbed app using `-m app`
-    cwd = Path(__file__).parent / "testbed/simple"
+    cwd = TESTBED_PATH / "simple"
     output = run_app(["-m", "app"], cwd=cwd)
-    assert_paths(output, app_path=Path(toga.__file__).parent, app_name="simple-app")
+    assert_paths(output, app_path=TOGA_PATH, app_name="simple-app")
 
 
 def test_simple_as_deep_file():
     """When a simple app is started as `python simple/app.py`, the app path is the
     folder holding app.py."""
     # Spawn the simple testbed app using `simple/app.py`
-    cwd = Path(__file__).parent / "testbed"
+    cwd = TESTBED_PATH
     output = run_app(["simple/app.py"], cwd=cwd)
-    assert_paths(output, app_path=Path(toga.__file__).parent, app_name="simple-app")
+    assert_paths(output, app_path=TOGA_PATH, app_name="simple-app")
 
 
 def test_simple_as_deep_module():
     """When a simple app is started as `python -m simple`, the app path is the folder
     holding app.py."""
     # Spawn the simple testbed app using `-m simple`
-    cwd = Path(__file__).parent / "testbed"
+    cwd = TESTBED_PATH
     output = run_app(["-m", "simple"], cwd=cwd)
-    assert_paths(output, app_path=Path(toga.__file__).parent, app_name="simple-app")
+    assert_paths(output, app_path=TOGA_PATH, app_name="simple-app")
 
 
 def test_subclassed_as_file_in_module():
     """When a subclassed app is started as `python app.py` inside a runnable module, the
     app path is the folder holding app.py."""
     # Spawn the simple testbed app using `app.py`
-    cwd = Path(__file__).parent / "testbed/subclassed"
+    cwd = TESTBED_PATH / "subclassed"
     output = run_app(["app.py"], cwd=cwd)
     assert_paths(output, app_path=cwd, app_name="subclassed-app")
 
@@ -107,7 +110,7 @@ def test_subclassed_as_module():
     """When a subclassed app is started as `python -m app` inside a runnable module, the
     app path is the folder holding app.py."""
     # Spawn the subclassed testbed app using `-m app`
-    cwd = Path(__file__).parent / "testbed/subclassed"
+    cwd = TESTBED_PATH / "subclassed"
     output = run_app(["-m", "app"], cwd=cwd)
     assert_paths(output, app_path=cwd, app_name="subclassed-app")
 
@@ -116,7 +119,7 @@ def test_subclassed_as_deep_file():
     """When a subclassed app is started as `python simple/app.py`, the app path is the
     folder holding app.py."""
     # Spawn the subclassed testbed app using `subclassed/app.py`
-    cwd = Path(__file__).parent / "testbed"
+    cwd = TESTBED_PATH
     output = run_app(["subclassed/app.py"], cwd=cwd)
     assert_paths(output, app_path=cwd / "subclassed", app_name="subclassed-app")
 
@@ -125,7 +128,7 @@ def test_subclassed_as_deep_module():
     """When a subclassed app is started as `python -m simple`, the app path is the
     folder holding app.py."""
     # Spawn the subclassed testbed app using `-m subclassed`
-    cwd = Path(__file__).parent / "testbed"
+    cwd = TESTBED_PATH
     output = run_app(["-m", "subclassed"], cwd=cwd)
     assert_paths(output, app_path=cwd / "subclassed", app_name="subclassed-app")
 
@@ -8,6 +8,7 @@ import toga.platform
 from toga.platform import (
     Factory,
     current_platform,
+    find_backends,
     get_backend,
     get_current_platform,
     get_factory,
@@ -117,14 +118,23 @@ def test_get_current_platform_freebsd(monkeypatch, value):
     assert get_current_platform() == "freeBSD"
 
 
+def test_current_platform(monkeypatch):
+    """The current platform is evaluated lazily on first access."""
+    monkeypatch.delattr(toga.platform, "current_platform")
+    monkeypatch.setattr(sys, "platform", "ios")
+    assert toga.platform.current_platform == "iOS"
+
+
 def _get_backend():
     get_platform_factory.cache_clear()
     get_backend.cache_clear()
+    find_backends.cache_clear()
     if hasattr(toga.platform, "backend"):
         del toga.platform.backend
     backend = get_backend()
     get_platform_factory.cache_clear()
     get_backend.cache_clear()
+    find_backends.cache_clear()
     if hasattr(toga.platform, "backend"):
         del toga.platform.backend
     return backend
@@ -134,6 +144,7 @@ def _get_factory():
     get_factory.cache_clear()
     get_platform_factory.cache_clear()
     get_backend.cache_clear()
+    find_backends.cache_clear()
     if hasattr(toga.platform, "backend"):
         del toga.platform.backend
     try:
@@ -142,6 +153,7 @@ def _get_factory():
         get_factory.cache_clear()
         get_platform_factory.cache_clear()
         get_backend.cache_clear()
+        find_backends.cache_clear()
         if hasattr(toga.platform, "backend"):
             del toga.platform.backend
 
@@ -149,6 +161,7 @@ def _get_factory():
 def _get_platform_factory():
     get_platform_factory.cache_clear()
     get_backend.cache_clear()
+    find_backends.cache_clear()
     if hasattr(toga.platform, "backend"):
         del toga.platform.backend
     try:
@@ -156,6 +169,7 @@ def _get_platform_factory():
     finally:
         get_platform_factory.cache_clear()
         get_backend.cache_clear()
+        find_backends.cache_clear()
         if hasattr(toga.platform, "backend"):
             del toga.platform.backend
 
@@ -163,6 +177,7 @@ def _get_platform_factory():
 def _import_backend():
     get_platform_factory.cache_clear()
     get_backend.cache_clear()
+    find_backends.cache_clear()
     if hasattr(toga.platform, "backend"):
         del toga.platform.backend
     try:
@@ -174,6 +189,7 @@ def _import_backend():
             del toga.platform.backend
         get_platform_factory.cache_clear()
         get_backend.cache_clear()
+        find_backends.cache_clear()
 
 
 def test_no_platforms(monkeypatch, clean_env):
@@ -389,6 +405,28 @@ def test_factory_class_interface():
     assert factory.group == "togax_dummy.backend.toga_dummy"
 
 
+def test_get_factory_interface():
+    """A factory for a custom interface loads its entry points lazily."""
+    get_factory.cache_clear()
+    try:
+        factory = get_factory("togax_dummy")
+        assert isinstance(factory, Factory)
+        assert factory._entrypoints is None
+
+        # Looking up an implementation loads the entry points.
+        with pytest.raises(
+            NotImplementedError,
+            match=(
+                r"The 'toga_dummy' backend for the togax_dummy interface "
+                r"doesn't implement Widget"
+            ),
+        ):
+            _ = factory.Widget
+        assert factory._entrypoints is not None
+    finally:
+        get_factory.cache_clear()
+
+
 def test_factor_class_warns_toga():
     """Test custom factory class creation with toga_* namespace."""
     with pytest.warns(
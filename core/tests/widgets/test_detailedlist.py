@@ -5,6 +5,7 @@ import pytest
 import toga
 from toga.sources import ListSource
 from toga_dummy.utils import (
+    EventLog,
     assert_action_not_performed,
     assert_action_performed,
     assert_action_performed_with,
@@ -278,6 +279,35 @@ def test_refresh(detailedlist, on_refresh_handler):
     )
 
 
+def test_reassign_same_handlers(
+    detailedlist,
+    on_select_handler,
+    on_refresh_handler,
+    on_primary_action_handler,
+    on_secondary_action_handler,
+):
+    """Re-assigning the current handlers doesn't reconfigure the backend."""
+    on_select = detailedlist.on_select
+    EventLog.reset()
+
+    detailedlist.on_select = on_select_handler
+    detailedlist.on_refresh = on_refresh_handler
+    detailedlist.on_primary_action = on_primary_action_handler
+    detailedlist.on_secondary_action = on_secondary_action_handler
+
+    # The wrapped handler has been retained
+    assert detailedlist.on_select is on_select
+
+    assert_action_not_performed(detailedlist, "refresh enabled")
+    assert_action_not_performed(detailedlist, "primary action enabled")
+    assert_action_not_performed(detailedlist, "secondary action enabled")
+
+    # Assigning a different handler reconfigures the backend.
+    detailedlist.on_refresh = None
+    assert detailedlist.on_refresh._raw is None
+    assert_action_performed_with(detailedlist, "refresh enabled", enabled=False)
+
+
 def test_scroll_to_top(detailedlist):
     """A DetailedList can be scrolled to the top."""
     detailedlist.scroll_to_top()
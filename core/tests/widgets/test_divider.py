@@ -73,6 +73,20 @@ def test_update_direction():
     assert_action_performed(divider, "refresh")
 
 
+def test_update_direction_unchanged():
+    """Setting the divider to its current direction is a no-op."""
+    divider = toga.Divider(direction=toga.Divider.HORIZONTAL)
+
+    # Reset the event log.
+    EventLog.reset()
+
+    divider.direction = toga.Divider.HORIZONTAL
+
+    # No refresh was requested
+    assert divider.direction == toga.Divider.HORIZONTAL
+    assert_action_not_performed(divider, "refresh")
+
+
 def test_focus_noop():
     """Focus is a no-op."""
     divider = toga.Divider(direction=toga.Divider.HORIZONTAL)
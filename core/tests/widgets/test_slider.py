@@ -4,7 +4,11 @@ import pytest
 from pytest import approx, fixture, raises
 
 import toga
-from toga_dummy.utils import assert_action_performed, attribute_value
+from toga_dummy.utils import (
+    assert_action_performed,
+    attribute_value,
+    attribute_values,
+)
 
 INITIAL_VALUE = 50
 INITIAL_MIN = 0
@@ -124,6 +128,21 @@ def test_set_value_to_be_too_big(slider, on_change):
     assert_value(slider, on_change, tick_value=11, value=INITIAL_MAX, change_count=1)
 
 
+def test_set_value_unchanged(slider, on_change):
+    """Setting the value to the current value doesn't update the backend."""
+    set_count = len(attribute_values(slider, "value"))
+
+    slider.value = INITIAL_VALUE
+    assert len(attribute_values(slider, "value")) == set_count
+    assert_value(
+        slider,
+        on_change,
+        tick_value=INITIAL_TICK_VALUE,
+        value=INITIAL_VALUE,
+        change_count=0,
+    )
+
+
 def test_set_tick_value_between_min_and_max(slider, on_change):
     value = 30
     tick_value = 4
@@ -354,6 +373,30 @@ def test_set_tick_count(slider, on_change, tick_count, tick_step, tick_value, va
     )
 
 
+def test_set_value_backend_error(slider, on_change, monkeypatch):
+    """If the backend fails to set a value, the on_change handler is restored, but not
+    invoked."""
+
+    def set_value(value):
+        raise RuntimeError("Backend failure")
+
+    monkeypatch.setattr(slider._impl, "set_value", set_value)
+    with raises(RuntimeError, match=r"Backend failure"):
+        slider.value = 75
+
+    assert slider.on_change._raw is on_change
+    on_change.assert_not_called()
+
+
+def test_tick_step_empty_range(slider):
+    """A discrete slider with an empty range has no tick step."""
+    slider.max = INITIAL_MIN
+
+    assert slider.tick_count == INITIAL_TICK_COUNT
+    assert slider.tick_step is None
+    assert slider.tick_value is None
+
+
 @pytest.mark.parametrize(TICK_PARAM_NAMES, TICK_PARAM_VALUES)
 def test_set_value_with_tick_count(
     slider, on_change, tick_count, tick_step, tick_value, value
@@ -388,6 +431,16 @@ def test_set_tick_count_too_small(slider, on_change):
             slider.tick_count = tick_count
 
 
+def test_set_tick_count_refreshes_value(slider, on_change):
+    """Changing the tick count always refreshes the backend value, even if the
+    value doesn't change."""
+    set_count = len(attribute_values(slider, "value"))
+
+    slider.tick_count = None
+    assert attribute_values(slider, "value")[set_count:] == [INITIAL_VALUE]
+    assert_value(slider, on_change, INITIAL_VALUE, tick_value=None, change_count=0)
+
+
 def test_focus(slider, on_change):
     slider.focus()
     assert_action_performed(slider, "focus")
@@ -411,6 +464,52 @@ def test_set_on_release():
     assert slider.on_release._raw == on_release
 
 
+def test_reassign_same_handlers(slider, on_change):
+    """Re-assigning the current handlers retains the existing wrapped handlers."""
+    on_press = Mock()
+    on_release = Mock()
+    slider.on_press = on_press
+    slider.on_release = on_release
+    wrapped = (slider.on_change, slider.on_press, slider.on_release)
+
+    slider.on_change = on_change
+    slider.on_press = on_press
+    slider.on_release = on_release
+    assert (slider.on_change, slider.on_press, slider.on_release) == wrapped
+
+    # Assigning a different handler replaces the wrapped handler.
+    slider.on_press = None
+    assert slider.on_press is not wrapped[1]
+    assert slider.on_press._raw is None
+
+
+def test_default_handlers():
+    """A slider without handlers has no-op handlers installed."""
+    slider = toga.Slider()
+    for handler in [slider.on_change, slider.on_press, slider.on_release]:
+        assert handler._raw is None
+        assert handler() is None
+
+
+def test_programmatic_change_retains_handler(slider, on_change):
+    """A programmatic change restores the installed on_change handler."""
+    wrapped = slider.on_change
+
+    slider.value = 75
+    assert slider.on_change is wrapped
+    on_change.assert_called_once_with(slider)
+
+
+def test_programmatic_change_releases_handler(slider, on_change):
+    """A programmatic change doesn't keep a reference to a replaced handler."""
+    slider.value = 75
+    on_change.assert_called_once_with(slider)
+
+    # The saved state is cleared once the change is complete.
+    assert slider._programmatic_change._on_change is None
+    assert slider._programmatic_change._old_value is None
+
+
 def assert_value(slider, on_change, value, *, tick_value=None, change_count=0):
     """Asserts that the slider's `value` and `tick_value` attributes have the given
     values, and that `on_change` has been called `change_count` times."""
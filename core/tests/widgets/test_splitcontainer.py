@@ -2,6 +2,7 @@ import pytest
 
 import toga
 from toga_dummy.utils import (
+    EventLog,
     assert_action_not_performed,
     assert_action_performed,
     assert_action_performed_with,
@@ -134,6 +135,36 @@ def test_assign_unassign_window_app_on_content(
     assert content2.window is None
 
 
+def test_retain_content_on_reassignment(app, window, content1, content2, content3):
+    """Content that is retained when content is reassigned stays attached."""
+    splitcontainer = toga.SplitContainer(content=[content1, content2])
+    splitcontainer.app = app
+    splitcontainer.window = window
+
+    # Swap the panels, and replace one of them.
+    splitcontainer.content = [content2, content3]
+
+    assert content1.app is None
+    assert content1.window is None
+    with pytest.raises(KeyError):
+        window.widgets[content1.id]
+
+    for content in [content2, content3]:
+        assert content.app == app
+        assert content.window == window
+        assert window.widgets[content.id] is content
+
+    # Invalid content is rejected without detaching the existing content.
+    with pytest.raises(ValueError, match=r"must be >0"):
+        splitcontainer.content = [content1, (content2, 0)]
+
+    assert splitcontainer.content == [content2, content3]
+    for content in [content2, content3]:
+        assert content.app == app
+        assert content.window == window
+    assert content1.app is None
+
+
 @pytest.mark.parametrize(
     "include_left, include_right",
     [
@@ -418,3 +449,14 @@ def test_direction(splitcontainer):
 
     # The split container has been refreshed
     assert_action_performed(splitcontainer, "refresh")
+
+
+def test_direction_unchanged(splitcontainer):
+    """Setting the splitcontainer to its current direction is a no-op."""
+    assert splitcontainer.direction == toga.SplitContainer.VERTICAL
+    EventLog.reset()
+
+    splitcontainer.direction = toga.SplitContainer.VERTICAL
+
+    # No refresh was requested
+    assert_action_not_performed(splitcontainer, "refresh")
@@ -1,3 +1,5 @@
+from toga.constants import Direction
+
 from .base import Widget
 
 
@@ -6,7 +8,7 @@ class Divider(Widget):
         self._action("create Divider")
 
     def get_direction(self):
-        return self._get_value("direction")
+        return self._get_value("direction", Direction.HORIZONTAL)
 
     def set_direction(self, value):
         self._set_value("direction", value)
@@ -1,6 +1,14 @@
 import toga
 from toga.constants import BOLD, COLUMN, ITALIC, MONOSPACE, NORMAL, ROW
 
+# The (label suffix, weight, style) of each font variant to display.
+FONT_VARIANTS = [
+    ("", NORMAL, NORMAL),
+    (" bold", BOLD, NORMAL),
+    (" italic", NORMAL, ITALIC),
+    (" bold italic", BOLD, ITALIC),
+]
+
 
 class FontApp(toga.App):
     textpanel = None
@@ -55,12 +63,6 @@ class FontApp(toga.App):
             "Roboto", "resources/Roboto-BoldItalic.ttf", weight=BOLD, style=ITALIC
         )
 
-        button_style = {
-            "font_family": "awesome-free-solid",
-            "font_size": 14,
-            "width": 50,
-        }
-
         # Buttons
         btn_box1 = toga.Box(
             direction=ROW,
@@ -78,86 +80,40 @@ class FontApp(toga.App):
             on_press=self.do_monospace_button,
             font_family=MONOSPACE,
         )
-        btn2 = toga.Button(
-            "\uf0c5",
-            id="copy",
-            on_press=self.do_icon_button,
-            **button_style,
-        )
-        btn3 = toga.Button(
-            "\uf0ea",
-            id="paste",
-            on_press=self.do_icon_button,
-            **button_style,
-        )
-        btn4 = toga.Button(
-            "\uf0a9",
-            id="arrow-right",
-            on_press=self.do_icon_button,
-            **button_style,
-        )
+        # Icon buttons, using glyphs from the Font Awesome font.
+        icon_buttons = [
+            toga.Button(
+                text,
+                id=button_id,
+                on_press=self.do_icon_button,
+                font_family="awesome-free-solid",
+                font_size=14,
+                width=50,
+            )
+            for text, button_id in [
+                ("\uf0c5", "copy"),
+                ("\uf0ea", "paste"),
+                ("\uf0a9", "arrow-right"),
+            ]
+        ]
         btn_box2 = toga.Box(
             direction=ROW,
             margin_bottom=10,
-            children=[btn1, btn2, btn3, btn4],
-        )
-
-        # Labels
-        lbl1 = toga.Label("Endor", font_family="Endor", font_size=14)
-        lbl2 = toga.Label(
-            "Endor bold",
-            font_family="Endor",
-            font_size=14,
-            font_weight=BOLD,
-        )
-        lbl3 = toga.Label(
-            "Endor italic",
-            font_family="Endor",
-            font_size=14,
-            font_style=ITALIC,
-        )
-        lbl4 = toga.Label(
-            "Endor bold italic",
-            font_family="Endor",
-            font_size=14,
-            font_weight=BOLD,
-            font_style=ITALIC,
-        )
-        lbl5 = toga.Label(
-            "Roboto",
-            font_family="Roboto",
-            font_size=14,
-        )
-        lbl6 = toga.Label(
-            "Roboto bold",
-            font_family="Roboto",
-            font_size=14,
-            font_weight=BOLD,
-        )
-        lbl7 = toga.Label(
-            "Roboto italic",
-            font_family="Roboto",
-            font_size=14,
-            font_style=ITALIC,
-        )
-        lbl8 = toga.Label(
-            "Roboto bold italic",
-            font_family="Roboto",
-            font_size=14,
-            font_weight=BOLD,
-            font_style=ITALIC,
-        )
-
-        unknown_style = {"font_family": "Unknown", "font_size": 14}
-        lbl_u = toga.Label("Unknown", **unknown_style)
-        lbl_ub = toga.Label("Unknown bold", font_weight=BOLD, **unknown_style)
-        lbl_ui = toga.Label("Unknown italic", font_style=ITALIC, **unknown_style)
-        lbl_ubi = toga.Label(
-            "Unknown bold italic",
-            font_weight=BOLD,
-            font_style=ITALIC,
-            **unknown_style,
-        )
+            children=[btn1, *icon_buttons],
+        )
+
+        # Labels, in each weight and style of each font family.
+        labels = [
+            toga.Label(
+                f"{family}{suffix}",
+                font_family=family,
+                font_size=14,
+                font_weight=weight,
+                font_style=style,
+            )
+            for family in ["Endor", "Roboto", "Unknown"]
+            for suffix, weight, style in FONT_VARIANTS
+        ]
         lbl_times = toga.Label(
             "System font (Times/Times Roman/Noto Serif)",
             font_family=["Times", "Times-Roman", "Times New Roman", "Noto Serif"],
@@ -168,24 +124,7 @@ class FontApp(toga.App):
             readonly=False, flex=1, placeholder="Ready."
         )
 
-        self.labels = toga.Box(
-            children=[
-                lbl1,
-                lbl2,
-                lbl3,
-                lbl4,
-                lbl5,
-                lbl6,
-                lbl7,
-                lbl8,
-                lbl_u,
-                lbl_ub,
-                lbl_ui,
-                lbl_ubi,
-                lbl_times,
-            ],
-            direction=COLUMN,
-        )
+        self.labels = toga.Box(children=[*labels, lbl_times], direction=COLUMN)
         # Outermost box
         outer_box = toga.Box(
             children=[
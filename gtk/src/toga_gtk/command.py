@@ -15,7 +15,7 @@ class Command:
         self.native = []
 
     @classmethod
-    def standard(self, app, id):
+    def standard(cls, app, id):
         match id:
             # ---- App menu -----------------------------------
             case StandardCommand.PREFERENCES:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+
 from rubicon.objc import NSObject, objc_method, objc_property
 
 from toga import LatLng
@@ -11,13 +13,21 @@ from toga_iOS.libs import (
     NSBundle,
 )
 
+# Authorization statuses that grant (foreground) access to location data.
+AUTHORIZED_STATUSES = frozenset(
+    {
+        CLAuthorizationStatus.AuthorizedWhenInUse.value,
+        CLAuthorizationStatus.AuthorizedAlways.value,
+    }
+)
+AUTHORIZED_ALWAYS = CLAuthorizationStatus.AuthorizedAlways.value
+
 
 def toga_location(location):
     """Convert a Cocoa location into a Toga LatLng and altitude."""
-    latlng = LatLng(
-        location.coordinate.latitude,
-        location.coordinate.longitude,
-    )
+    # Each attribute access crosses the ObjC bridge; only retrieve the coordinate once.
+    coordinate = location.coordinate
+    latlng = LatLng(coordinate.latitude, coordinate.longitude)
 
     # A vertical accuracy that non-positive indicates altitude is invalid.
     if location.verticalAccuracy > 0.0:
@@ -38,7 +48,7 @@ class TogaLocationDelegate(NSObject):
     @objc_method
     def locationManagerDidChangeAuthorization_(self, manager) -> None:
         while self.impl.permission_requests:
-            future, permission = self.impl.permission_requests.pop()
+            future, permission = self.impl.permission_requests.popleft()
             future.set_result(permission())
 
     @objc_method
@@ -49,7 +59,7 @@ class TogaLocationDelegate(NSObject):
 
         # Set all outstanding location requests with location reported
         while self.impl.current_location_requests:
-            future = self.impl.current_location_requests.pop()
+            future = self.impl.current_location_requests.popleft()
             future.set_result(toga_loc["location"])
 
         # If we're tracking, notify the change listener of the last location reported
@@ -60,7 +70,7 @@ class TogaLocationDelegate(NSObject):
     def locationManager_didFailWithError_(self, manager, error) -> None:
         # Cancel all outstanding location requests.
         while self.impl.current_location_requests:
-            future = self.impl.current_location_requests.pop()
+            future = self.impl.current_location_requests.popleft()
             future.set_exception(RuntimeError(f"Unable to obtain a location ({error})"))
 
 
@@ -87,20 +97,15 @@ class Location:
             )
 
         # Tracking of futures associated with specific requests.
-        self.permission_requests = []
-        self.current_location_requests = []
+        # Outstanding requests are resolved in the order they were made.
+        self.permission_requests = deque()
+        self.current_location_requests = deque()
 
     def has_permission(self):
-        return self.native.authorizationStatus in {
-            CLAuthorizationStatus.AuthorizedWhenInUse.value,
-            CLAuthorizationStatus.AuthorizedAlways.value,
-        }
+        return self.native.authorizationStatus in AUTHORIZED_STATUSES
 
     def has_background_permission(self):
-        return (
-            self.native.authorizationStatus
-            == CLAuthorizationStatus.AuthorizedAlways.value
-        )
+        return self.native.authorizationStatus == AUTHORIZED_ALWAYS
 
     def request_permission(self, future):
         self.permission_requests.append((future, self.has_permission))
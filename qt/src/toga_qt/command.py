@@ -46,7 +46,7 @@ class Command:
         self.native = []
 
     @classmethod
-    def standard(self, app, id):
+    def standard(cls, app, id):
         match id:
             # ---- File menu ----------
             case StandardCommand.PREFERENCES:
@@ -7,6 +7,13 @@ from toga import LatLng
 
 from .probe import list_probes
 
+# Error messages raised by the location service
+BACKGROUND_BEFORE_FOREGROUND = (
+    r"Cannot ask for background location permission "
+    r"before confirming foreground location permission\."
+)
+NO_PERMISSION = r"App does not have permission to use location services"
+
 
 @pytest.fixture(params=list_probes("location", skip_platforms=("windows",)))
 async def location_probe(monkeypatch, app_probe, request):
@@ -75,13 +82,7 @@ async def test_grant_background_permission(app, location_probe):
 
     # Foreground permissions haven't been approved, so requesting background permissions
     # will raise an error
-    with pytest.raises(
-        PermissionError,
-        match=(
-            r"Cannot ask for background location permission "
-            r"before confirming foreground location permission\."
-        ),
-    ):
+    with pytest.raises(PermissionError, match=BACKGROUND_BEFORE_FOREGROUND):
         await app.location.request_background_permission()
 
     # Pre-approve foreground permissions
@@ -112,13 +113,7 @@ async def test_deny_background_permission(app, location_probe):
 
     # Foreground permissions haven't been approved, so requesting background permissions
     # will raise an error.
-    with pytest.raises(
-        PermissionError,
-        match=(
-            r"Cannot ask for background location permission "
-            r"before confirming foreground location permission\."
-        ),
-    ):
+    with pytest.raises(PermissionError, match=BACKGROUND_BEFORE_FOREGROUND):
         await app.location.request_background_permission()
 
     # Neither permission does not exist yet
@@ -302,20 +297,11 @@ async def test_no_permission(app, location_probe):
     # Deny permission to use location
     location_probe.reject_permission()
 
-    with pytest.raises(
-        PermissionError,
-        match=r"App does not have permission to use location services",
-    ):
+    with pytest.raises(PermissionError, match=NO_PERMISSION):
         await app.location.current_location()
 
-    with pytest.raises(
-        PermissionError,
-        match=r"App does not have permission to use location services",
-    ):
+    with pytest.raises(PermissionError, match=NO_PERMISSION):
         app.location.start_tracking()
 
-    with pytest.raises(
-        PermissionError,
-        match=r"App does not have permission to use location services",
-    ):
+    with pytest.raises(PermissionError, match=NO_PERMISSION):
         app.location.stop_tracking()
@@ -72,3 +72,18 @@ async def test_directions(widget, probe):
     assert widget.direction == Direction.HORIZONTAL
     assert probe.height < 10
     assert probe.width > 100
+
+
+async def test_set_direction_round_trip(widget):
+    "The direction reported by the backend matches the direction that was set"
+    assert widget.direction == Direction.HORIZONTAL
+
+    # Setting the direction to its current value is a no-op.
+    widget.direction = Direction.HORIZONTAL
+    assert widget.direction == Direction.HORIZONTAL
+
+    widget.direction = Direction.VERTICAL
+    assert widget.direction == Direction.VERTICAL
+
+    widget.direction = Direction.VERTICAL
+    assert widget.direction == Direction.VERTICAL
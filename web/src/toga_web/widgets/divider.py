@@ -6,11 +6,13 @@ from .base import Widget
 class Divider(Widget):
     def create(self):
         self.native = self._create_native_widget("wa-divider")
+        self._direction = Direction.HORIZONTAL
 
     def get_direction(self):
-        return self.interface.direction
+        return self._direction
 
     def set_direction(self, value):
+        self._direction = value
         if value is Direction.VERTICAL:
             self.native.setAttribute("orientation", "vertical")
         else:
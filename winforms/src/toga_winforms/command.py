@@ -8,12 +8,22 @@ from toga_winforms.keys import toga_to_winforms_key, toga_to_winforms_shortcut
 
 
 class Command:
+    # Menu items hold a weak reference to winforms_Click, so instances must remain
+    # weak-referenceable.
+    __slots__ = ("interface", "native", "click_handler", "_enabled", "__weakref__")
+
     def __init__(self, interface):
         self.interface = interface
         self.native = []
+        # Every native item for this command (menu items and toolbar buttons) shares
+        # a single weak wrapper around the click handler.
+        self.click_handler = WeakrefCallable(self.winforms_Click)
+        # The enabled state most recently applied to the native items. New items are
+        # created with the current state, so they never need to be updated.
+        self._enabled = None
 
     @classmethod
-    def standard(self, app, id):
+    def standard(cls, app, id):
         match id:
             # ---- File menu -----------------------------------
             case StandardCommand.NEW:
@@ -90,30 +100,31 @@ class Command:
         return self.interface.action()
 
     def set_enabled(self, value):
-        if self.native:
+        enabled = self.interface.enabled
+        if enabled != self._enabled:
+            self._enabled = enabled
             for widget in self.native:
-                widget.Enabled = self.interface.enabled
+                widget.Enabled = enabled
 
     def create_menu_item(self, WinformsClass):
         item = WinformsClass(self.interface.text)
 
-        item.Click += WeakrefCallable(self.winforms_Click)
-        if self.interface.shortcut is not None:
+        item.Click += self.click_handler
+        shortcut = self.interface.shortcut
+        if shortcut is not None:
             try:
-                item.ShortcutKeys = toga_to_winforms_key(self.interface.shortcut)
+                item.ShortcutKeys = toga_to_winforms_key(shortcut)
                 # The Winforms key enum is... daft. The "oem" key
                 # values render as "Oem" or "Oemcomma", so we need to
                 # *manually* set the display text for the key shortcut.
-                item.ShortcutKeyDisplayString = toga_to_winforms_shortcut(
-                    self.interface.shortcut
-                )
+                item.ShortcutKeyDisplayString = toga_to_winforms_shortcut(shortcut)
             except (
                 ValueError,
                 InvalidEnumArgumentException,
             ) as e:  # pragma: no cover
                 # Make this a non-fatal warning, because different backends may
                 # accept different shortcuts.
-                print(f"WARNING: invalid shortcut {self.interface.shortcut!r}: {e}")
+                print(f"WARNING: invalid shortcut {shortcut!r}: {e}")
 
         item.Enabled = self.interface.enabled
 
@@ -1,6 +1,6 @@
 import operator
 import re
-from functools import reduce
+from functools import cache, reduce
 from string import ascii_lowercase
 
 import System.Windows.Forms as WinForms
@@ -75,6 +75,9 @@ SHIFTED_KEYS.update(
 )
 
 
+# Shortcuts are converted each time a menu item is created for a command, so cache
+# the conversions; the set of distinct shortcuts in an app is small.
+@cache
 def toga_to_winforms_key(key):
     # Convert a Key object into string form.
     try:
@@ -105,6 +108,7 @@ def toga_to_winforms_key(key):
     return reduce(operator.or_, codes)
 
 
+@cache
 def toga_to_winforms_shortcut(key):
     # The Winforms key enum is... daft. The "oem" key values render as "Oem" or
     # "Oemcomma", so we need to *manually* set the display text for the key
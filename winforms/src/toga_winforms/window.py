@@ -503,7 +503,7 @@ class MainWindow(Window):
                     if cmd.icon is not None:
                         item.Image = cmd.icon._impl.native.ToBitmap()
                     item.Enabled = cmd.enabled
-                    item.Click += WeakrefCallable(cmd._impl.winforms_Click)
+                    item.Click += cmd._impl.click_handler
                     cmd._impl.native.append(item)
                 self.toolbar_native.Items.Add(item)
 